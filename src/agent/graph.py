@@ -1,10 +1,14 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
 from deepagents import create_deep_agent
 from deepagents.backends import CompositeBackend, StoreBackend
 from langchain.chat_models import init_chat_model
+from langchain.tools import ToolRuntime
 from langchain_core.runnables import RunnableConfig
+from langgraph.store.base import BaseStore
 
 from agent.memory_middleware import AgentMemoryMiddleware
 from agent.sandbox import create_daytona_sandbox
@@ -15,6 +19,24 @@ from agent.settings import settings
 # You may want to replace this with a more powerful model
 model = init_chat_model('openai:gpt-5-mini')
 
+logger = logging.getLogger(__name__)
+
+# Every latency-critical path here (LLM calls, sandbox RPCs, store reads, HTTP tools) is I/O-bound,
+# so the wins come from connection reuse, batching, parallel dispatch and prompt caching.
+
+
+async def _prewarm_model() -> None:
+    """Open a pooled connection to the model provider so the first turn skips TCP/TLS setup."""
+    client = getattr(model, "root_async_client", None)
+    if client is None:
+        return
+    try:
+        # Listing models is free, unlike a throwaway completion
+        await client.models.list()
+    except Exception as e:
+        logger.warning("Model pre-warm failed: %s", e)
+
+
 def get_system_prompt() -> str:
     """Get the base system prompt for the agent.
     Returns:
@@ -78,6 +100,8 @@ def get_system_prompt() -> str:
         )
 
 
+# The base prompt only depends on settings, so build it once at import time
+BASE_SYSTEM_PROMPT = get_system_prompt()
 
 agent_tools = [http_request, fetch_url, web_search]
 
@@ -96,15 +120,37 @@ async def agent(config: RunnableConfig):
     async with create_daytona_sandbox() as sandbox_backend:
         # Set up a composite back end where most operations occur in the sandbox,
         # but memories are pulled from LangSmith's managed long-term memory store
-        composite_backend = lambda rt: CompositeBackend(
-            default=sandbox_backend,
-            routes={"/memories/": StoreBackend(rt)}
-        )
+        # deepagents calls the factory per tool runtime; the store is shared for the whole
+        # run, so reuse the composite backend instead of rebuilding it on every call.
+        # Note the cached StoreBackend keeps the first call's runtime and resolves its namespace
+        # from that runtime's config. This is only correct because the assistant_id it namespaces
+        # on cannot change within a run; rebuild per call if the namespace ever depends on more.
+        cached_backend: tuple[BaseStore | None, CompositeBackend] | None = None
+
+        def composite_backend(rt: ToolRuntime) -> CompositeBackend:
+            nonlocal cached_backend
+            if cached_backend is None or cached_backend[0] is not rt.store:
+                cached_backend = (rt.store, CompositeBackend(
+                    default=sandbox_backend,
+                    routes={"/memories/": StoreBackend(rt)}
+                ))
+            return cached_backend[1]
+
         agent = create_deep_agent(
             model=model,
-            system_prompt=get_system_prompt(),
-            middleware=[memory_middleware, skills_middleware],
+            system_prompt=BASE_SYSTEM_PROMPT,
+            # The first middleware is the outermost layer and extends the system prompt first. The memory
+            # middleware goes last so its volatile <user_memory> block ends up at the very end of the prompt.
+            middleware=[skills_middleware, memory_middleware],
             tools=agent_tools,
             backend=composite_backend,
         ).with_config({"recursion_limit": 1000})
-        yield agent
+
+        # Pre-warm only once the sandbox is ready: idle keep-alive connections are dropped after a few
+        # seconds, so a connection opened before sandbox startup would be gone by the first model call
+        prewarm = asyncio.create_task(_prewarm_model()) if settings.pre_warm_model else None
+        try:
+            yield agent
+        finally:
+            if prewarm is not None:
+                prewarm.cancel()
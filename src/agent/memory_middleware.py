@@ -2,10 +2,11 @@
 Middleware for loading agent-specific long-term memory into the system prompt.
 Uses LangSmith Deployment's long-term persistence
 """
-import json
+import sys
 from collections.abc import Awaitable, Callable
-from typing import NotRequired, TypedDict, cast
+from typing import Any, NotRequired, TypedDict, cast
 
+import orjson
 from langchain.agents.middleware.types import (
     AgentMiddleware,
     AgentState,
@@ -20,6 +21,8 @@ from agent.settings import settings
 class AgentMemoryState(AgentState):
     """State for the agent memory middleware."""
 
+    # Kept as the serialized prompt text rather than msgpack bytes: the checkpointer
+    # already encodes state with msgpack, and the prompt needs the text form anyway.
     user_memory: NotRequired[str]
     """User preferences from /memories/{assistant}/ (applies everywhere)."""
 
@@ -96,6 +99,10 @@ edit_file '{agent_dir_absolute}/agent.json' ...        # Update user preferences
 ``
 """
 
+# Literal segments between the {agent_dir_absolute} slots, split once at import so
+# each middleware instance can build its block with a single join
+_LONGTERM_MEMORY_SEGMENTS = tuple(LONGTERM_MEMORY_SYSTEM_PROMPT.split("{agent_dir_absolute}"))
+
 
 DEFAULT_MEMORY_SNIPPET = """<user_memory>
 {user_memory}
@@ -103,6 +110,24 @@ DEFAULT_MEMORY_SNIPPET = """<user_memory>
 """
 
 
+def _serialize_memories(memories: Any) -> str:
+    """Serialize the stored memory item for the state.
+
+    Shared by the sync and async before_agent hooks.
+
+    Args:
+        memories: The item returned from the memory store, or None.
+
+    Returns:
+        The JSON-serialized memory, or an empty string if there is no stored item.
+    """
+    # Stored as "" rather than "null" so the prompt shows the no-memory placeholder,
+    # while the key is still set and the store is not re-read on the next invocation
+    if memories is None:
+        return ""
+    return orjson.dumps(memories, default=str).decode()
+
+
 class AgentMemoryMiddleware(AgentMiddleware):
     """Middleware for loading agent-specific long-term memory.
 
@@ -125,8 +150,12 @@ class AgentMemoryMiddleware(AgentMiddleware):
         # Configure memory path
         self.assistant_id = assistant_id
         self.agent_dir_absolute = settings.memories_base_path_template.format(assistant_id=assistant_id)
+        self._memory_namespace = ("memories", str(assistant_id))
+        self._memory_key = "agent.json"
         self.system_prompt_template = DEFAULT_MEMORY_SNIPPET
-
+        self._empty_memory_section = self.system_prompt_template.format(user_memory="(No user agent.md)")
+        # The long-term memory block only depends on the assistant, so build it once
+        self._longterm_block = sys.intern(self.agent_dir_absolute.join(_LONGTERM_MEMORY_SEGMENTS))
 
     def before_agent(
         self,
@@ -146,10 +175,12 @@ class AgentMemoryMiddleware(AgentMiddleware):
         """
         result: AgentMemoryStateUpdate = {}
 
-        # Load user memory if not already in state
+        # Load user memory if not already in state. before_agent runs once per invocation rather than
+        # per model turn, and user_memory is checkpointed with the thread, so the store is only read
+        # once per thread.
         if "user_memory" not in state:
-            memories = runtime.store.get(("memories", f"{self.assistant_id}"), "agent.json")
-            result["user_memory"] = json.dumps(memories, default=str)
+            memories = runtime.store.get(self._memory_namespace, self._memory_key)
+            result["user_memory"] = _serialize_memories(memories)
 
         return result
 
@@ -171,13 +202,40 @@ class AgentMemoryMiddleware(AgentMiddleware):
         """
         result: AgentMemoryStateUpdate = {}
 
-        # Load user memory if not already in state
+        # Load user memory if not already in state (see before_agent)
         if "user_memory" not in state:
-            memories = await runtime.store.aget(("memories", f"{self.assistant_id}"), "agent.json")
-            result["user_memory"] = json.dumps(memories, default=str)
+            memories = await runtime.store.aget(self._memory_namespace, self._memory_key)
+            result["user_memory"] = _serialize_memories(memories)
 
         return result
 
+    def _assemble_system_prompt(self, base_system_prompt: str | None, user_memory: str | None) -> str:
+        """Assemble the system prompt from its memory and base sections.
+
+        Args:
+            base_system_prompt: The system prompt provided on the request, if any.
+            user_memory: The serialized user memory, if any.
+
+        Returns:
+            Complete system prompt with memory sections injected.
+        """
+        # Format memory section
+        if user_memory:
+            memory_section = self.system_prompt_template.format(user_memory=user_memory)
+        else:
+            memory_section = self._empty_memory_section
+
+        # Static sections come first and the volatile user memory last, so the prompt
+        # prefix stays byte-identical across turns and can hit provider prompt caches.
+        # This relies on this middleware running last in the agent's middleware list.
+        system_prompt = ""
+        if base_system_prompt:
+            system_prompt += base_system_prompt + "\n\n"
+
+        system_prompt += self._longterm_block + "\n\n" + memory_section
+
+        return system_prompt
+
     def _build_system_prompt(self, request: ModelRequest) -> str:
         """Build the complete system prompt with memory sections.
 
@@ -191,23 +249,7 @@ class AgentMemoryMiddleware(AgentMiddleware):
         state = cast("AgentMemoryState", request.state)
         user_memory = state.get("user_memory")
 
-
-        # Format memory section
-        memory_section = self.system_prompt_template.format(
-            user_memory=user_memory if user_memory else "(No user agent.md)",
-        )
-
-        system_prompt = memory_section
-
-        base_system_prompt = request.system_prompt
-        if base_system_prompt:
-            system_prompt += "\n\n" + base_system_prompt
-
-        system_prompt += "\n\n" + LONGTERM_MEMORY_SYSTEM_PROMPT.format(
-            agent_dir_absolute=self.agent_dir_absolute,
-        )
-
-        return system_prompt
+        return self._assemble_system_prompt(request.system_prompt, user_memory)
 
     def wrap_model_call(
         self,
@@ -1,14 +1,20 @@
 import asyncio
+import io
+import logging
+import shlex
+import tarfile
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncGenerator
 
-from daytona import DaytonaConfig, AsyncDaytona, AsyncSandbox, FileUpload
+from daytona import DaytonaConfig, AsyncDaytona, AsyncSandbox, FileDownloadRequest, FileUpload
 from deepagents.backends.protocol import ExecuteResponse, FileDownloadResponse, FileUploadResponse
 from deepagents.backends.sandbox import BaseSandbox
 
 from agent.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class DaytonaBackend(BaseSandbox):
     """Daytona backend implementation conforming to SandboxBackendProtocol.
@@ -16,19 +22,29 @@ class DaytonaBackend(BaseSandbox):
     This implementation inherits all file operation methods from BaseSandbox
     and only implements the execute() method using Daytona's API.
 
-    Deepagents currently expects "execute" to not be an async function. Since we are using an async Daytona backend,
-    we keep the event loop of our agent server as an instance method here, so, within the sync method, we can
-    still have asyncio call the Daytona backend.
+    Deepagents currently expects "execute" and the file operations to not be async functions. Since we are
+    using an async Daytona backend, we keep the event loop of our agent server as an instance attribute here,
+    so, within the sync methods, we can still have asyncio call the Daytona backend. Each sync call blocks its
+    worker thread until the command completes.
+
+    The "aexecute", "adownload_files" and "aupload_files" coroutines are forward-looking only: the deepagents
+    version this project is locked to (and its CompositeBackend) never calls them. They hold the actual
+    Daytona calls, which the sync methods schedule on the server loop.
     """
 
-    def __init__(self, sandbox: AsyncSandbox, event_loop) -> None:
+    def __init__(self, sandbox: AsyncSandbox, event_loop: asyncio.AbstractEventLoop | None = None) -> None:
         """Initialize the DaytonaBackend with a Daytona sandbox client.
 
+        Must be constructed on the agent server's event loop unless one is passed explicitly.
+
         Args:
             sandbox: Daytona sandbox instance
+            event_loop: Loop the sync methods schedule onto. Defaults to the running loop.
         """
         self._sandbox = sandbox
-        self._loop = event_loop
+        # Captured here rather than looked up per call: the sync methods run in worker
+        # threads, where there is no running loop and context variables may not propagate.
+        self._loop = event_loop or asyncio.get_running_loop()
 
     @property
     def id(self) -> str:
@@ -47,10 +63,23 @@ class DaytonaBackend(BaseSandbox):
         Returns:
             ExecuteResponse with combined output, exit code, optional signal, and truncation flag.
         """
-        async def execute():
-            return await self._sandbox.process.exec(command)
-        future = asyncio.run_coroutine_threadsafe(execute(), self._loop)
-        result = future.result()
+        # Block this worker thread until the command completes on the agent server's loop
+        future = asyncio.run_coroutine_threadsafe(self.aexecute(command), self._loop)
+        return future.result()
+
+    async def aexecute(
+        self,
+        command: str,
+    ) -> ExecuteResponse:
+        """(async) Execute a command in the sandbox and return ExecuteResponse.
+
+        Args:
+            command: Full shell command string to execute.
+
+        Returns:
+            ExecuteResponse with combined output, exit code, optional signal, and truncation flag.
+        """
+        result = await self._sandbox.process.exec(command)
         return ExecuteResponse(
             output=result.result,  # Daytona combines stdout/stderr
             exit_code=result.exit_code,
@@ -74,11 +103,23 @@ class DaytonaBackend(BaseSandbox):
         TODO: Map Daytona API error strings to standardized FileOperationError codes.
         Currently only implements happy path.
         """
-        from daytona import FileDownloadRequest
+        future = asyncio.run_coroutine_threadsafe(self.adownload_files(paths), self._loop)
+        return future.result()
 
+    async def adownload_files(self, paths: list[str]) -> list[FileDownloadResponse]:
+        """(async) Download multiple files from the Daytona sandbox.
+
+        Args:
+            paths: List of file paths to download.
+
+        Returns:
+            List of FileDownloadResponse objects, one per input path.
+            Response order matches input order.
+        """
         # Create batch download request using Daytona's native batch API
-        download_requests = [FileDownloadRequest(source=path) for path in paths]
-        daytona_responses = self._sandbox.fs.download_files(download_requests)
+        daytona_responses = await self._sandbox.fs.download_files(
+            [FileDownloadRequest(source=path) for path in paths]
+        )
 
         # Convert Daytona results to our response format
         # TODO: Map resp.error to standardized error codes when available
@@ -108,40 +149,89 @@ class DaytonaBackend(BaseSandbox):
         TODO: Map Daytona API error strings to standardized FileOperationError codes.
         Currently only implements happy path.
         """
-        from daytona import FileUpload
+        future = asyncio.run_coroutine_threadsafe(self.aupload_files(files), self._loop)
+        return future.result()
+
+    async def aupload_files(self, files: list[tuple[str, bytes]]) -> list[FileUploadResponse]:
+        """(async) Upload multiple files to the Daytona sandbox.
+
+        Args:
+            files: List of (path, content) tuples to upload.
+
+        Returns:
+            List of FileUploadResponse objects, one per input file.
+            Response order matches input order.
+        """
+        # Build the Daytona requests and our responses in a single pass over the input
+        upload_requests: list[FileUpload] = []
+        responses: list[FileUploadResponse] = []
+        for path, content in files:
+            upload_requests.append(FileUpload(source=content, destination=path))
+            # TODO: Check if Daytona returns error info and map to FileOperationError codes
+            responses.append(FileUploadResponse(path=path, error=None))
 
         # Create batch upload request using Daytona's native batch API
-        upload_requests = [FileUpload(source=content, destination=path) for path, content in files]
-        self._sandbox.fs.upload_files(upload_requests)
+        await self._sandbox.fs.upload_files(upload_requests)
+        return responses
+
+
+SANDBOX_STARTUP_TIMEOUT = 180
+SANDBOX_POLL_INITIAL_DELAY = 0.1
+SANDBOX_POLL_MAX_DELAY = 2.0
+SKILLS_ARCHIVE_PATH = "/tmp/skills.tar.gz"
 
-        # TODO: Check if Daytona returns error info and map to FileOperationError codes
-        return [FileUploadResponse(path=path, error=None) for path, _ in files]
+
+def build_skills_archive() -> bytes:
+    """
+    Bundle the skills directory into a compressed tarball.
+
+    This only touches the local filesystem, so it can run while the sandbox is still being created.
+    """
+    skills_dir = Path(__file__).parent / "skills"
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        tar.add(skills_dir, arcname=".")
+    return buf.getvalue()
 
 
-async def upload_skills(sandbox: AsyncSandbox) -> None:
+async def upload_skills(sandbox: AsyncSandbox, archive: bytes) -> None:
     """
     Upload the skills directory to the sandbox so we can read and execute files, including any code within the skills.
+
+    The skills are uploaded as a single archive from build_skills_archive() and extracted inside the sandbox, so the
+    upload is one request regardless of how many files the skills contain.
     """
-    def get_files():
-        files_to_upload = []
-        skills_dir = Path(__file__).parent / "skills"
-        for file_path in skills_dir.rglob("*"):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(skills_dir)
-                with open(file_path, "rb") as f:
-                    files_to_upload.append(
-                        FileUpload(
-                            source=f.read(),
-                            destination=f"/home/daytona/skills/{rel_path.as_posix()}",
-                        )
-                    )
-        return files_to_upload
-    files_to_upload = await asyncio.to_thread(get_files)
+    # The base path is user-configurable, so quote it for the shell
+    skills_base_path = shlex.quote(settings.skills_base_path.as_posix())
+    archive_path = shlex.quote(SKILLS_ARCHIVE_PATH)
     try:
-        await sandbox.fs.upload_files(files_to_upload)
-        pass
+        await sandbox.fs.upload_files([FileUpload(source=archive, destination=SKILLS_ARCHIVE_PATH)])
+        result = await sandbox.process.exec(
+            f"mkdir -p {skills_base_path} && tar xzf {archive_path} -C {skills_base_path} && rm {archive_path}"
+        )
+        if result.exit_code != 0:
+            logger.warning("Failed to extract skills: %s", result.result)
     except Exception as e:
-        print(e)
+        logger.warning("Failed to upload skills: %s", e)
+
+
+_DAYTONA_CLIENT: AsyncDaytona | None = None
+_DAYTONA_LOCK = asyncio.Lock()
+
+
+async def _get_client() -> AsyncDaytona:
+    """Return the shared Daytona client, creating it on first use.
+
+    The client is reused across sandbox creations so each session only pays for `create()`.
+    """
+    global _DAYTONA_CLIENT
+    async with _DAYTONA_LOCK:
+        if _DAYTONA_CLIENT is None:
+            # Creating the client involves some synchronous reads to the local filesystem, hence the call to to_thread
+            _DAYTONA_CLIENT = await asyncio.to_thread(
+                lambda: AsyncDaytona(DaytonaConfig(api_key=settings.daytona_api_key))
+            )
+    return _DAYTONA_CLIENT
 
 
 @asynccontextmanager
@@ -153,31 +243,47 @@ async def create_daytona_sandbox() -> AsyncGenerator:
 
     print("Starting Daytona sandbox...")
 
-    # Creating the client involves some synchronous reads to the local filesystem, hence the call to to_thread
-    daytona = await asyncio.to_thread(lambda: AsyncDaytona(DaytonaConfig(api_key=settings.daytona_api_key)))
-    sandbox = await daytona.create()
+    # Build the skills archive while the sandbox is being created
+    skills_archive = asyncio.create_task(asyncio.to_thread(build_skills_archive))
+    try:
+        daytona = await _get_client()
+        sandbox = await daytona.create()
+    except BaseException:
+        skills_archive.cancel()
+        raise
     sandbox_id = sandbox.id
 
-    # Poll until running (Daytona requires this)
-    for _ in range(90):  # 180s timeout (90 * 2s)
+    # Poll until running (Daytona requires this), backing off exponentially so a
+    # sandbox that is ready quickly is picked up without waiting a full interval
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SANDBOX_STARTUP_TIMEOUT
+    delay = SANDBOX_POLL_INITIAL_DELAY
+    while loop.time() < deadline:
         # Check if sandbox is ready by attempting a simple command
         try:
-            result = await sandbox.process.exec("echo ready", timeout=5)
+            result = await sandbox.process.exec("echo ready", timeout=1)
             if result.exit_code == 0:
-                await upload_skills(sandbox)
                 break
         except Exception as e:
             print("Error creating sandbox: retrying", e)
-        await asyncio.sleep(2)
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, SANDBOX_POLL_MAX_DELAY)
     else:
+        skills_archive.cancel()
         try:
             # Clean up if possible
             await sandbox.delete()
         finally:
-            raise RuntimeError("Daytona sandbox failed to start within 180 seconds")
+            raise RuntimeError(f"Daytona sandbox failed to start within {SANDBOX_STARTUP_TIMEOUT} seconds")
 
-    loop = asyncio.get_running_loop()
-    backend = DaytonaBackend(sandbox, loop)
+    try:
+        archive = await skills_archive
+    except Exception as e:
+        logger.warning("Failed to build skills archive: %s", e)
+    else:
+        await upload_skills(sandbox, archive)
+
+    backend = DaytonaBackend(sandbox)
     print(f"✓ Daytona sandbox ready: {backend.id}")
     try:
         yield backend
@@ -1,17 +1,27 @@
-import os
 from pathlib import Path
 from typing import Optional
 
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, computed_field
 
 
 class Settings(BaseSettings):
     tavily_api_key: Optional[str] = Field(default=None, validation_alias="TAVILY_API_KEY")
     daytona_api_key: Optional[str] = Field(default=None, validation_alias="DAYTONA_API_KEY")
-    daytona_base_path: Path = "/home/daytona"
-    skills_base_path: Path = os.path.join(daytona_base_path, "skills")
+    daytona_base_path: Path = Path("/home/daytona")
     memories_base_path_template: str = "/memories/{assistant_id}/"
     max_skill_file_size: int = 10 * 1024 * 1024 # 10 MB
+    skill_frontmatter_max_bytes: int = 4096
+    skills_reload_ttl: float = 30.0 # seconds
+    pre_warm_model: bool = Field(default=False, validation_alias="PRE_WARM")
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def skills_base_path(self) -> Path:
+        """Skills directory inside the sandbox.
+
+        Derived from daytona_base_path so that overrides of the base path are respected.
+        """
+        return self.daytona_base_path / "skills"
 
 settings = Settings()
@@ -14,8 +14,10 @@ skills/
 │   ├── SKILL.md
 │   └── checklist.md
 """
+import asyncio
 import os
-import re
+import sys
+import time
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import NotRequired, TypedDict, cast
@@ -26,6 +28,7 @@ from langchain.agents.middleware.types import (
     ModelRequest,
     ModelResponse,
 )
+from langgraph.runtime import Runtime
 
 from agent.settings import settings
 
@@ -41,51 +44,107 @@ class SkillMetadata(TypedDict):
     path: str
     """Path to the SKILL.md file."""
 
+    dir_name: str
+    """Name of the skill's directory."""
 
-def _parse_skill_metadata(skill_md_path: Path) -> SkillMetadata | None:
-    """Parse YAML frontmatter from a SKILL.md file.
+
+# Parsed SKILL.md metadata keyed by path, with the (mtime_ns, size) stamp it was parsed at
+_SKILLS_CACHE: dict[str, tuple[tuple[int, int], SkillMetadata | None]] = {}
+
+
+def _parse_skill_metadata(skill_md_path: str, dir_name: str, stat: os.stat_result) -> SkillMetadata | None:
+    """Parse YAML frontmatter from a SKILL.md file, reusing the last result if the file is unchanged.
+
+    Args:
+        skill_md_path: Path to the SKILL.md file.
+        dir_name: Name of the skill's directory.
+        stat: Stat result for the file.
+
+    Returns:
+        SkillMetadata with name, description, and path, or None if parsing fails.
+    """
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _SKILLS_CACHE.get(skill_md_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    metadata = _read_skill_metadata(skill_md_path, dir_name, stat.st_size)
+    _SKILLS_CACHE[skill_md_path] = (stamp, metadata)
+    return metadata
+
+
+def _split_frontmatter(content: str) -> str | None:
+    """Return the YAML frontmatter between leading --- delimiter lines, or None if there is none.
+
+    Uses plain string slicing rather than a DOTALL regex so the document body is never backtracked over.
+    """
+    if not content.startswith("---"):
+        return None
+    start = content.find("\n", 3)
+    if start < 0 or content[3:start].strip():
+        return None
+
+    pos = start
+    while (end := content.find("\n---", pos)) >= 0:
+        line_end = content.find("\n", end + 4)
+        if line_end < 0:
+            line_end = len(content)
+        # The closing delimiter must be on a line of its own
+        if not content[end + 4:line_end].strip():
+            return content[start + 1:end]
+        pos = end + 4
+    return None
+
+
+def _read_skill_metadata(skill_md_path: str, dir_name: str, file_size: int) -> SkillMetadata | None:
+    """Read and parse YAML frontmatter from a SKILL.md file.
 
     Args:
         skill_md_path: Path to the SKILL.md file.
+        dir_name: Name of the skill's directory.
+        file_size: Size of the file in bytes.
 
     Returns:
         SkillMetadata with name, description, and path, or None if parsing fails.
     """
     try:
         # Security: Check file size to prevent DoS attacks
-        file_size = skill_md_path.stat().st_size
         if file_size > settings.max_skill_file_size:
             # Silently skip files that are too large
             return None
 
-        content = skill_md_path.read_text(encoding="utf-8")
-
-        # Match YAML frontmatter between --- delimiters
-        frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(frontmatter_pattern, content, re.DOTALL)
-
-        if not match:
+        # Only the frontmatter is needed, which must open the file and close within the first few KB
+        with open(skill_md_path, "rb") as f:
+            prefix = f.read(3)
+            if prefix != b"---":
+                return None
+            head = prefix + f.read(settings.skill_frontmatter_max_bytes - len(prefix))
+        content = head.decode("utf-8", errors="ignore")
+
+        # Extract YAML frontmatter between --- delimiters
+        frontmatter = _split_frontmatter(content)
+        if frontmatter is None:
             return None
 
-        frontmatter = match.group(1)
-
         # Parse key-value pairs from YAML (simple parsing, no nested structures)
         metadata: dict[str, str] = {}
         for line in frontmatter.split("\n"):
             # Match "key: value" pattern
-            kv_match = re.match(r"^(\w+):\s*(.+)$", line.strip())
-            if kv_match:
-                key, value = kv_match.groups()
-                metadata[key] = value.strip()
+            key, _, value = line.strip().partition(":")
+            value = value.strip()
+            if key.isidentifier() and value:
+                metadata[key] = value
 
         # Validate required fields
         if "name" not in metadata or "description" not in metadata:
             return None
 
+        # Interned since the same strings are reused across reloads and cache keys
         return SkillMetadata(
-            name=metadata["name"],
-            description=metadata["description"],
-            path=str(skill_md_path),
+            name=sys.intern(metadata["name"]),
+            description=sys.intern(metadata["description"]),
+            path=sys.intern(skill_md_path),
+            dir_name=sys.intern(dir_name),
         )
 
     except (OSError, UnicodeDecodeError):
@@ -118,40 +177,86 @@ def list_skills() -> list[SkillMetadata]:
     """
     # Check if skills directory exists
     skills_dir = Path(os.path.join(Path(__file__).parent, "skills"))
-    print(skills_dir)
 
+    # Look for a SKILL.md file in each subdirectory, keeping paths as plain strings
+    with os.scandir(skills_dir) as entries:
+        candidates = [
+            (os.path.join(entry.path, "SKILL.md"), entry.name)
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+        ]
+
+    # Directories without a SKILL.md fail the stat and are skipped
     skills: list[SkillMetadata] = []
-    print(os.listdir(skills_dir))
-    # Iterate through subdirectories
-    for skill_dir in skills_dir.iterdir():
-        # Look for SKILL.md file
-        skill_md_path = skill_dir / "SKILL.md"
-        if not skill_md_path.exists():
+    for skill_md_path, dir_name in candidates:
+        try:
+            stat = os.stat(skill_md_path)
+        except OSError:
+            _SKILLS_CACHE.pop(skill_md_path, None)
             continue
 
-        # Parse metadata
-        metadata = _parse_skill_metadata(skill_md_path)
+        metadata = _parse_skill_metadata(skill_md_path, dir_name, stat)
         if metadata:
             skills.append(metadata)
 
     return skills
 
 
+async def alist_skills() -> list[SkillMetadata]:
+    """(async) List all skills from the skills directory.
+
+    Runs list_skills() in a worker thread so the filesystem scan does not block the event loop.
+
+    Returns:
+        List of skill metadata dictionaries with name, description, and path.
+    """
+    return await asyncio.to_thread(list_skills)
+
+
+# Most recent list_skills() result and when it was taken. Kept at module level because a new
+# middleware is built for every run, so per-instance state would never reach the reload TTL.
+_loaded_skills: tuple[float, list[SkillMetadata]] | None = None
+
+
+def _get_skills() -> list[SkillMetadata]:
+    """Return the loaded skills, loading them on first use and once the reload TTL has elapsed."""
+    global _loaded_skills
+    loaded = _loaded_skills
+    if loaded is None or time.monotonic() - loaded[0] >= settings.skills_reload_ttl:
+        loaded = (time.monotonic(), list_skills())
+        _loaded_skills = loaded
+    return loaded[1]
+
+
+async def _aget_skills() -> list[SkillMetadata]:
+    """(async) Return the loaded skills, loading them on first use and once the reload TTL has elapsed."""
+    global _loaded_skills
+    loaded = _loaded_skills
+    if loaded is None or time.monotonic() - loaded[0] >= settings.skills_reload_ttl:
+        loaded = (time.monotonic(), await alist_skills())
+        _loaded_skills = loaded
+    return loaded[1]
+
+
 class SkillsState(AgentState):
     """State for the skills middleware."""
 
     skills_metadata: NotRequired[list[SkillMetadata]]
-    """List of loaded skill metadata (name, description, path)."""
+    """List of loaded skill metadata (name, description, path, dir_name)."""
 
 
 class SkillsStateUpdate(TypedDict):
     """State update for the skills middleware."""
 
     skills_metadata: list[SkillMetadata]
-    """List of loaded skill metadata (name, description, path)."""
+    """List of loaded skill metadata (name, description, path, dir_name)."""
 
 
 # Skills System Documentation
+# This is injected on every model call, not just the first: the system prompt is rebuilt per call and is
+# not part of the message history, so guidance dropped on later calls would be lost for the rest of the
+# session. It is appended directly after the base prompt and before the per-user memory sections, so
+# its stable text is part of the prompt prefix shared by every user and can hit provider prompt caches.
 SKILLS_SYSTEM_PROMPT = """
 
 ## Skills System
@@ -200,6 +305,12 @@ Remember: Skills are tools to make you more capable and consistent. When in doub
 """
 
 
+SKILLS_SECTION_CACHE_SIZE = 8
+
+# Placeholder for the skills list in the partially-formatted prompt template
+_SKILLS_LIST_SLOT = "\x00SKILLS_LIST\x00"
+
+
 class SkillsMiddleware(AgentMiddleware):
     """Middleware for loading and exposing agent skills.
 
@@ -220,21 +331,34 @@ class SkillsMiddleware(AgentMiddleware):
             assistant_id: The agent identifier.
         """
         self.system_prompt_template = SKILLS_SYSTEM_PROMPT
+        # The skills dir never changes at runtime, so bake it in once and leave only the skills list dynamic
+        self._partial_template = self.system_prompt_template.replace(
+            "{skills_dir_absolute}", str(settings.skills_base_path)
+        ).replace("{skills_list}", _SKILLS_LIST_SLOT)
+        # Formatted skills sections keyed on the skills they list, evicted in insertion order
+        self._section_cache: dict[tuple[tuple[str, str, str], ...], str] = {}
 
     def _format_skills_list(self, skills: list[SkillMetadata]) -> str:
         """Format skills metadata for display in system prompt."""
         if not skills:
             return f"(No skills available yet. You can create skills in the skills dir)"
 
-        lines = []
-        for skill in skills:
-            skill_dir = Path(skill["path"]).parent.name
-            lines.append(f"- **{skill['name']}**: {skill['description']}")
-            lines.append(
-                f"  → Read `{skill_dir}/SKILL.md` for full instructions"
-            )
+        return "\n".join(
+            f"- **{skill['name']}**: {skill['description']}\n"
+            f"  → Read `{skill['dir_name']}/SKILL.md` for full instructions"
+            for skill in skills
+        )
 
-        return "\n".join(lines)
+    def _get_skills_section(self, skills: list[SkillMetadata]) -> str:
+        """Return the formatted skills section of the system prompt, reusing it if the skills are unchanged."""
+        key = tuple((skill["name"], skill["description"], skill["dir_name"]) for skill in skills)
+        section = self._section_cache.get(key)
+        if section is None:
+            section = self._partial_template.replace(_SKILLS_LIST_SLOT, self._format_skills_list(skills))
+            if len(self._section_cache) >= SKILLS_SECTION_CACHE_SIZE:
+                del self._section_cache[next(iter(self._section_cache))]
+            self._section_cache[key] = section
+        return section
 
     def before_agent(
         self,
@@ -252,11 +376,52 @@ class SkillsMiddleware(AgentMiddleware):
         Returns:
             Updated state with skills_metadata populated.
         """
-        # We re-load skills on every new interaction with the agent to capture
-        # any changes in the skills directory.
-        skills = list_skills()
+        # Skills are loaded on first use and re-loaded at most once per skills_reload_ttl
+        # to pick up changes in the skills directory.
+        skills = _get_skills()
+        return SkillsStateUpdate(skills_metadata=skills)
+
+    async def abefore_agent(  # type: ignore[override]
+        self,
+        state: SkillsState,
+        runtime: Runtime,
+    ) -> SkillsStateUpdate | None:
+        """(async) Load skills metadata before agent execution.
+
+        The first load, and any reload once the TTL has elapsed, scans the skills directory
+        in a worker thread via alist_skills() so the event loop is not blocked.
+
+        Args:
+            state: Current agent state.
+            runtime: Runtime context.
+
+        Returns:
+            Updated state with skills_metadata populated.
+        """
+        skills = await _aget_skills()
         return SkillsStateUpdate(skills_metadata=skills)
 
+    def _build_system_prompt(self, request: ModelRequest) -> str:
+        """Build the complete system prompt with the skills section injected.
+
+        Args:
+            request: The model request containing state and base system prompt.
+
+        Returns:
+            Complete system prompt with the skills section appended.
+        """
+        # The state is guaranteed to be SkillsState due to state_schema
+        state = cast("SkillsState", request.state)
+        skills_metadata = state.get("skills_metadata", [])
+
+        # Format the skills documentation
+        skills_section = self._get_skills_section(skills_metadata)
+
+        # Inject into system prompt
+        if request.system_prompt:
+            return request.system_prompt + "\n\n" + skills_section
+        return skills_section
+
     def wrap_model_call(
         self,
         request: ModelRequest,
@@ -273,23 +438,7 @@ class SkillsMiddleware(AgentMiddleware):
         Returns:
             The model response from the handler.
         """
-        # Get skills metadata from state
-        skills_metadata = request.state.get("skills_metadata", [])
-
-        # Format skills list
-        skills_list = self._format_skills_list(skills_metadata)
-
-        # Format the skills documentation
-        skills_section = self.system_prompt_template.format(
-            skills_list=skills_list,
-            skills_dir_absolute=str(settings.skills_base_path),
-        )
-
-        if request.system_prompt:
-            system_prompt = request.system_prompt + "\n\n" + skills_section
-        else:
-            system_prompt = skills_section
-
+        system_prompt = self._build_system_prompt(request)
         return handler(request.override(system_prompt=system_prompt))
 
     async def awrap_model_call(
@@ -306,23 +455,5 @@ class SkillsMiddleware(AgentMiddleware):
         Returns:
             The model response from the handler.
         """
-        # The state is guaranteed to be SkillsState due to state_schema
-        state = cast("SkillsState", request.state)
-        skills_metadata = state.get("skills_metadata", [])
-
-        # Format skills list
-        skills_list = self._format_skills_list(skills_metadata)
-
-        # Format the skills documentation
-        skills_section = self.system_prompt_template.format(
-            skills_list=skills_list,
-            skills_dir_absolute=str(settings.skills_base_path),
-        )
-
-        # Inject into system prompt
-        if request.system_prompt:
-            system_prompt = request.system_prompt + "\n\n" + skills_section
-        else:
-            system_prompt = skills_section
-
+        system_prompt = self._build_system_prompt(request)
         return await handler(request.override(system_prompt=system_prompt))
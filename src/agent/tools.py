@@ -3,6 +3,7 @@
 from typing import Any, Literal
 
 import requests
+from requests.adapters import HTTPAdapter
 from markdownify import markdownify
 from tavily import TavilyClient
 from agent.settings import settings
@@ -12,6 +13,22 @@ tavily_client = None
 if settings.tavily_api_key:
     tavily_client = TavilyClient(api_key=settings.tavily_api_key)
 
+# Shared connection pool so repeated tool calls reuse keep-alive connections instead of paying a
+# new TCP/TLS handshake per request. Only the adapter is shared: each call gets its own session so
+# cookies never leak between runs or users. The urllib3 pool behind the adapter is thread-safe.
+_http_adapter = HTTPAdapter(pool_maxsize=20)
+
+
+def _http_session() -> requests.Session:
+    """Return a fresh session backed by the shared connection pool.
+
+    The session must not be closed, since closing it would also close the shared adapter.
+    """
+    session = requests.Session()
+    session.mount("http://", _http_adapter)
+    session.mount("https://", _http_adapter)
+    return session
+
 
 def http_request(
     url: str,
@@ -47,7 +64,7 @@ def http_request(
             else:
                 kwargs["data"] = data
 
-        response = requests.request(**kwargs)
+        response = _http_session().request(**kwargs)
 
         try:
             content = response.json()
@@ -158,7 +175,7 @@ def fetch_url(url: str, timeout: int = 30) -> dict[str, Any]:
     4. NEVER show the raw markdown to the user unless specifically requested
     """
     try:
-        response = requests.get(
+        response = _http_session().get(
             url,
             timeout=timeout,
             headers={"User-Agent": "Mozilla/5.0 (compatible; DeepAgents/1.0)"},